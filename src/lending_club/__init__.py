@@ -1,7 +1,15 @@
 """Lending Club package."""
 
-__all__ = ["create_model_pipeline", "train_test_split", "execute_processing", "evaluate", "plot_roc_curve"]
+__all__ = [
+    "create_model_pipeline",
+    "train_test_split",
+    "execute_processing",
+    "evaluate",
+    "plot_roc_curve",
+    "load_loans",
+]
 
 from .eval import evaluate, plot_roc_curve
 from .fitting import create_model_pipeline, train_test_split
+from .io import load_loans
 from .processing import execute_processing
@@ -4,24 +4,23 @@ __all__ = ["evaluate", "plot_roc_curve"]
 
 import matplotlib.pyplot as plt
 import pandas as pd
-from sklearn.metrics import (
-    accuracy_score,
-    classification_report,
-    confusion_matrix,
-    f1_score,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-    roc_curve,
-)
+from sklearn.metrics import auc, classification_report, confusion_matrix, roc_curve
 
 
 def evaluate(test: pd.Series, pred: pd.Series) -> None:
-    """Evaluate model performance."""
+    """Evaluate model performance.
 
-    accuracy = accuracy_score(test, pred)
-    conf_matrix = confusion_matrix(test, pred)
+    Accuracy, precision, recall and f1-score of the positive class are derived from the confusion matrix.
+    """
+
+    conf_matrix = confusion_matrix(test, pred, labels=[0, 1])
     class_report = classification_report(test, pred)
+    tn, fp, fn, tp = conf_matrix.ravel()
+
+    accuracy = (tp + tn) / conf_matrix.sum()
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
 
     print(f"Accuracy: {accuracy}")
 
@@ -31,14 +30,14 @@ def evaluate(test: pd.Series, pred: pd.Series) -> None:
     print("Classification Report:")
     print(class_report)
 
-    print(f"Precision score is {precision_score(test,pred)}")
-    print(f"Recall score is {recall_score(test,pred)}")
-    print(f"f1-score is {f1_score(test,pred)}")
+    print(f"Precision score is {precision}")
+    print(f"Recall score is {recall}")
+    print(f"f1-score is {f1}")
 
 
 def plot_roc_curve(test: pd.Series, prob: pd.Series) -> None:
-    fpr, tpr, thresholds = roc_curve(test, prob)
-    roc_auc = roc_auc_score(test, prob)
+    fpr, tpr, _ = roc_curve(test, prob)
+    roc_auc = auc(fpr, tpr)
 
     plt.figure()
     plt.plot(fpr, tpr, color="darkorange", lw=2, label=f"ROC curve (area = {roc_auc:.2f})")
@@ -1,12 +1,13 @@
 """Fitting module."""
 
+import numpy as np
 import pandas as pd
-from imblearn.over_sampling import SMOTE
-from imblearn.pipeline import Pipeline
+from joblib import Memory
 from sklearn.compose import ColumnTransformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import StratifiedShuffleSplit
-from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
 from .logger import log
 
@@ -15,8 +16,8 @@ def train_test_split(loans: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, p
     """Split data into train and test sets."""
     log.info("Split data into train and test sets...")
 
-    x = loans.drop(columns="LOAN_STATUS").copy()
-    y = loans["LOAN_STATUS"].copy()
+    x = loans.drop(columns="LOAN_STATUS")
+    y = loans["LOAN_STATUS"]
 
     shuffle = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
 
@@ -25,15 +26,19 @@ def train_test_split(loans: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, p
     return x.iloc[train_index], x.iloc[test_index], y.iloc[train_index], y.iloc[test_index]
 
 
-def create_model_pipeline() -> Pipeline:
-    """Creates model pipeline."""
+def create_model_pipeline(memory: str | Memory | None = None) -> Pipeline:
+    """Creates model pipeline.
+
+    Pass a cache directory or a joblib Memory as ``memory`` to reuse the fitted preprocessing between fits with
+    the same training data, e.g. when sweeping the classifier's hyperparameters.
+    """
     log.info("Creating model pipeline...")
 
     preprocessor = ColumnTransformer(
         transformers=[
             (
                 "scaler",
-                StandardScaler(),
+                StandardScaler(copy=False),
                 [
                     "LOAN_AMNT",
                     "INSTALLMENT",
@@ -46,7 +51,12 @@ def create_model_pipeline() -> Pipeline:
                     "REVOL_UTIL",
                     "TOTAL_ACC",
                 ],
-            )
+            ),
+            (
+                "encoder",
+                OneHotEncoder(sparse_output=True, dtype=np.int8, handle_unknown="ignore"),
+                ["HOME_OWNERSHIP", "VERIFICATION_STATUS", "PURPOSE", "TERM"],
+            ),
         ],
         remainder="passthrough",
         force_int_remainder_cols=False,
@@ -55,7 +65,7 @@ def create_model_pipeline() -> Pipeline:
     return Pipeline(
         [
             ("preprocessing", preprocessor),
-            ("resampling", SMOTE(sampling_strategy=0.6)),
-            ("classification", LogisticRegression(max_iter=1000)),
-        ]
+            ("classification", LogisticRegression(solver="liblinear", class_weight="balanced")),
+        ],
+        memory=memory,
     )
@@ -0,0 +1,65 @@
+"""Data loading module."""
+
+__all__ = ["load_loans"]
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
+
+from .logger import log
+
+# PyArrow only reads dictionaries with int32 indices, pandas narrows the categorical codes to int8 on conversion.
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+COLUMN_TYPES = {
+    "loan_amnt": pa.float32(),
+    "installment": pa.float32(),
+    "annual_inc": pa.float32(),
+    "dti": pa.float32(),
+    "fico_range_low": pa.float32(),
+    "fico_range_high": pa.float32(),
+    "inq_last_6mths": pa.float32(),
+    "open_acc": pa.float32(),
+    "revol_bal": pa.float32(),
+    "total_acc": pa.float32(),
+    # Stripped from their units during processing
+    "term": pa.string(),
+    "revol_util": pa.string(),
+    # Low cardinality, read as categoricals
+    "grade": CATEGORY,
+    "emp_length": CATEGORY,
+    "loan_status": CATEGORY,
+    "home_ownership": CATEGORY,
+    "verification_status": CATEGORY,
+    "purpose": CATEGORY,
+}
+
+
+def load_loans(path: str) -> pd.DataFrame:
+    """Load loans data.
+
+    The CSV file is parsed in parallel with PyArrow. Single-field rows, like the section title separating loans that
+    do not meet the credit policy, are skipped. Any other malformed row raises. Remaining strings are backed by
+    PyArrow.
+    """
+    log.info("Loading loans data...")
+    skipped = []
+
+    def skip_title_rows(row: csv.InvalidRow) -> str:
+        if row.actual_columns == 1:
+            skipped.append(row.text)
+            return "skip"
+
+        return "error"
+
+    table = csv.read_csv(
+        path,
+        read_options=csv.ReadOptions(block_size=1 << 24, use_threads=True),
+        parse_options=csv.ParseOptions(invalid_row_handler=skip_title_rows),
+        convert_options=csv.ConvertOptions(column_types=COLUMN_TYPES, strings_can_be_null=True),
+    )
+
+    if skipped:
+        log.info("Skipped %d title rows: %s", len(skipped), skipped)
+
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
@@ -30,118 +30,143 @@ MAPPING = Mapping(
     },
 )
 
+Lookup = namedtuple("Lookup", ["categories", "values", "missing"])
 
-def filter_loan_status(loans: pd.DataFrame) -> pd.DataFrame:
-    """Filter loan status.
-
-    There is some volume that has different statuses that we don't need for the inference.
-    """
-    log.info("Filtering loan status...")
-
-    return loans[loans["loan_status"].isin(["Fully Paid", "Charged Off"])]
 
+def _create_lookup(mapping: dict) -> Lookup:
+    """Create a lookup table indexed by categorical codes.
 
-def filter_missing_data(loans: pd.DataFrame) -> pd.DataFrame:
-    """Filter missing data.
-
-    Drop columns with more than half of the values missing.
+    Values not present in the mapping get code -1 and pick the trailing NaN entry, so the row is dropped later on.
+    Missing values are mapped separately with the NaN mapping, if any.
+    """
+    categories = pd.Index([key for key in mapping if not pd.isna(key)])
+
+    return Lookup(categories, np.array([mapping[key] for key in categories] + [np.nan]), mapping.get(np.nan, np.nan))
+
+
+LOOKUP = Mapping._make(_create_lookup(mapping) for mapping in MAPPING)
+
+
+UNNECESSARY_COLUMNS = [
+    "id",
+    "collection_recovery_fee",  # More than 90% zero
+    "total_rec_late_fee",  # More than 90% zero
+    "debt_settlement_flag",
+    "url",
+    "desc",
+    "total_pymnt",  # Leaks data from the future
+    "total_pymnt_inv",  # Leaks data from the future
+    "recoveries",
+    "zip_code",
+    "sub_grade",
+    "emp_title",
+    "int_rate",  # Information contained in grade column.
+    # Leaks data from the future
+    "last_fico_range_high",
+    "last_fico_range_low",
+    "issue_d",
+    "total_rec_prncp",
+    "total_rec_int",
+    "total_rec_late_fee",
+    "last_pymnt_d",
+    "last_pymnt_amnt",
+    "funded_amnt",
+    "funded_amnt_inv",
+    # One value is overwhelming
+    "pub_rec_bankruptcies",
+    "pub_rec",
+    "delinq_2yrs",
+    # Try some feature engineering on those below
+    "earliest_cr_line",
+    "last_credit_pull_d",
+    # Categorical too many unique values
+    "addr_state",
+    "title",
+]
+
+
+def filter_loans(loans: pd.DataFrame) -> pd.DataFrame:
+    """Filter loan status and remove unnecessary columns.
+
+    There is some volume that has different statuses that we don't need for the inference. For the column
+    description, please refer to the dictionary. Both selections are applied with a single copy of the data.
     """
-    log.info("Filtering missing data...")
+    log.info("Filtering loan status and removing unnecessary columns...")
 
-    return loans.dropna(thresh=int(len(loans) / 2), axis="columns")
+    return loans.loc[
+        loans["loan_status"].isin(["Fully Paid", "Charged Off"]),
+        loans.columns.difference(UNNECESSARY_COLUMNS, sort=False),
+    ]
 
 
-def remove_unnecessary_columns(loans: pd.DataFrame) -> pd.DataFrame:
-    """Remove unnecessary columns.
+def filter_columns(loans: pd.DataFrame) -> pd.DataFrame:
+    """Filter missing data and non unique values.
 
-    For the column description, please refer to the dictionary.
+    Drop columns with more than half of the values missing and columns holding a single value. Both statistics are
+    computed up front, so the frame is copied only once.
     """
-    log.info("Removing unnecessary columns...")
-
-    return loans.drop(
-        columns=[
-            "id",
-            "collection_recovery_fee",  # More than 90% zero
-            "total_rec_late_fee",  # More than 90% zero
-            "debt_settlement_flag",
-            "url",
-            "desc",
-            "total_pymnt",  # Leaks data from the future
-            "total_pymnt_inv",  # Leaks data from the future
-            "recoveries",
-            "zip_code",
-            "sub_grade",
-            "emp_title",
-            "int_rate",  # Information contained in grade column.
-            # Leaks data from the future
-            "last_fico_range_high",
-            "last_fico_range_low",
-            "issue_d",
-            "total_rec_prncp",
-            "total_rec_int",
-            "total_rec_late_fee",
-            "last_pymnt_d",
-            "last_pymnt_amnt",
-            "funded_amnt",
-            "funded_amnt_inv",
-            # One value is overwhelming
-            "pub_rec_bankruptcies",
-            "pub_rec",
-            "delinq_2yrs",
-            # Try some feature engineering on those below
-            "earliest_cr_line",
-            "last_credit_pull_d",
-            # Categorical too many unique values
-            "addr_state",
-            "title",
-        ]
-    )
+    log.info("Filtering missing data and non unique values...")
+    present = loans.notna().to_numpy().sum(axis=0)
+    unique = loans.nunique().to_numpy()
 
+    return loans.loc[:, (present >= int(len(loans) / 2)) & (unique != 1)]
 
-def filter_non_unique_values(loans: pd.DataFrame) -> pd.DataFrame:
-    """Filter non unique values."""
-    log.info("Filtering non unique values...")
 
-    return loans.loc[:, loans.nunique() != 1]
+def map_categorical(loans: pd.DataFrame, lookup: Mapping) -> pd.DataFrame:
+    """Map categorical columns.
 
-
-def map_categorical(loans: pd.DataFrame, mapping: Mapping) -> pd.DataFrame:
-    """Map categorical columns."""
+    Columns are gathered from the precomputed lookup tables with their categorical codes.
+    """
     log.info("Mapping categorical columns...")
+    for column, table in [
+        ("grade", lookup.grade_map),
+        ("emp_length", lookup.emp_length_map),
+        ("loan_status", lookup.loan_status_map),
+    ]:
+        values = table.values[pd.Categorical(loans[column], categories=table.categories).codes]
+        values[loans[column].isna().to_numpy()] = table.missing
+        loans[column] = values
+    loans["loan_status"] = loans["loan_status"].astype("int8")
 
-    return (
-        loans.assign(grade=loans["grade"].map(mapping.grade_map))
-        .assign(emp_length=loans["emp_length"].map(mapping.emp_length_map))
-        .assign(loan_status=loans["loan_status"].map(mapping.loan_status_map))
-    )
+    return loans
 
 
 def apply_transformations(loans: pd.DataFrame) -> pd.DataFrame:
     """Apply string transformation."""
     log.info("Applying transformation...")
+    strings = loans[["term", "revol_util", "home_ownership"]].astype("string[pyarrow]")
+    loans["term"] = strings["term"].str.strip(" months")
+    loans["revol_util"] = strings["revol_util"].str.rstrip("%").astype("float32")
+    loans["home_ownership"] = strings["home_ownership"].replace("NONE", "OTHER")
+    loans["fico_avg"] = loans[["fico_range_low", "fico_range_high"]].mean(axis="columns").astype("float32")
+    loans.drop(columns=["fico_range_low", "fico_range_high"], inplace=True)
 
-    return (
-        loans.assign(term=loans["term"].str.strip("months"))
-        .assign(revol_util=pd.to_numeric(loans["revol_util"].str.strip("%")))
-        .assign(home_ownership=loans["home_ownership"].replace("NONE", "OTHER"))
-        .assign(fico_avg=loans[["fico_range_low", "fico_range_high"]].mean(axis="columns"))
-        .drop(columns=["fico_range_low", "fico_range_high"])
-    )
+    return loans
 
 
-def create_dummies(loans: pd.DataFrame) -> pd.DataFrame:
-    """Create dummies."""
-    log.info("Creating dummies...")
-    columns = ["home_ownership", "verification_status", "purpose", "term"]
+def drop_missing_values(loans: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows with missing values.
+
+    The frame is returned as is when there is nothing to drop, since dropna would copy it anyway.
+    """
+    log.info("Dropping rows with missing values...")
+    missing = loans.isna().to_numpy().any(axis=1)
 
-    return pd.concat([loans, pd.get_dummies(loans[columns], dtype=int)], axis=1).drop(columns=columns).dropna()
+    return loans.loc[~missing] if missing.any() else loans
 
 
 def handle_outliers(loans: pd.DataFrame) -> pd.DataFrame:
-    """Handle outliers."""
+    """Handle outliers.
+
+    Numeric features are clipped to their 5th and 95th percentile and stored as float32. The target is left as is.
+    """
     log.info("Handling outliers...")
-    for feature in loans.select_dtypes(include="number"):
-        loans[feature] = loans[feature].clip(lower=loans[feature].quantile(0.05), upper=loans[feature].quantile(0.95))
+    columns = loans.select_dtypes(include="number").columns.drop("loan_status")
+    values = np.ascontiguousarray(loans[columns].to_numpy(dtype=np.float32))
+
+    lower, upper = np.nanquantile(values, [0.05, 0.95], axis=0)
+    np.clip(values, lower, upper, out=values)
+    loans[columns] = values
 
     return loans
 
@@ -149,23 +174,25 @@ def handle_outliers(loans: pd.DataFrame) -> pd.DataFrame:
 def to_upper(loans: pd.DataFrame) -> pd.DataFrame:
     """Convert to upper case."""
     log.info("Converting to upper case...")
-    loans.columns = [col.replace(" ", "").upper() for col in loans.columns]
+    loans.columns = loans.columns.str.replace(" ", "", regex=False).str.upper()
 
     return loans
 
 
 def execute_processing(loans: pd.DataFrame) -> pd.DataFrame:
-    """Execute processing."""
+    """Execute processing.
+
+    Rows and columns are filtered first, so that the remaining steps modify the reduced frame in place instead of
+    copying it at every stage.
+    """
     log.info("Processing data...")
 
     return (
-        filter_loan_status(loans)
-        .pipe(filter_missing_data)
-        .pipe(filter_non_unique_values)
-        .pipe(remove_unnecessary_columns)
-        .pipe(map_categorical, mapping=MAPPING)
+        filter_loans(loans)
+        .pipe(filter_columns)
+        .pipe(map_categorical, lookup=LOOKUP)
         .pipe(apply_transformations)
         .pipe(handle_outliers)
-        .pipe(create_dummies)
+        .pipe(drop_missing_values)
         .pipe(to_upper)
     )
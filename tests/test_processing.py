@@ -0,0 +1,38 @@
+"""Tests for the processing module."""
+
+import numpy as np
+import pandas as pd
+
+from lending_club.processing import LOOKUP, drop_missing_values, map_categorical
+
+
+def test_map_categorical_keeps_unmapped_values_missing():
+    loans = pd.DataFrame(
+        {
+            "grade": ["A", "Z", np.nan],
+            "emp_length": ["10+ years", "n/a", np.nan],
+            "loan_status": ["Fully Paid", "Charged Off", "Fully Paid"],
+        }
+    )
+
+    mapped = map_categorical(loans, lookup=LOOKUP)
+
+    np.testing.assert_array_equal(mapped["grade"], [1, np.nan, np.nan])
+    np.testing.assert_array_equal(mapped["emp_length"], [10, np.nan, 0])
+    np.testing.assert_array_equal(mapped["loan_status"], [0, 1, 0])
+    assert mapped["loan_status"].dtype == np.int8
+
+
+def test_unmapped_values_are_dropped():
+    loans = pd.DataFrame(
+        {
+            "grade": ["B", "C", "D"],
+            "emp_length": ["< 1 year", "n/a", np.nan],
+            "loan_status": ["Fully Paid", "Charged Off", "Charged Off"],
+        }
+    )
+
+    processed = drop_missing_values(map_categorical(loans, lookup=LOOKUP))
+
+    assert processed.index.tolist() == [0, 2]
+    np.testing.assert_array_equal(processed["emp_length"], [0, 0])